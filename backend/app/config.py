@@ -1,7 +1,8 @@
 """Application configuration and settings."""
 
 import os
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 from pydantic import BaseModel
 from dotenv import load_dotenv
@@ -10,6 +11,18 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+_MONTH_TOKENS = (
+    "JanAds", "FebAds", "MarAds", "AprAds", "MayAds", "JunAds",
+    "JulAds", "AugAds", "SepAds", "OctAds", "NovAds", "DecAds",
+)
+
+
+@lru_cache(maxsize=1)
+def _default_date_for(day: date) -> str:
+    """Format a day as YYYY.MM.DD (cached, so it's formatted once per day)."""
+    return day.strftime("%Y.%m.%d")
+
+
 class Settings(BaseModel):
     """Application settings."""
     
@@ -51,16 +64,12 @@ class Settings(BaseModel):
     @staticmethod
     def get_default_campaign() -> str:
         """Get default campaign name based on current month."""
-        month_tokens = [
-            "JanAds", "FebAds", "MarAds", "AprAds", "MayAds", "JunAds",
-            "JulAds", "AugAds", "SepAds", "OctAds", "NovAds", "DecAds"
-        ]
-        return month_tokens[datetime.now().month - 1]
+        return _MONTH_TOKENS[datetime.now().month - 1]
     
     @staticmethod
     def get_default_date() -> str:
         """Get today's date in YYYY.MM.DD format."""
-        return datetime.now().strftime("%Y.%m.%d")
+        return _default_date_for(date.today())
 
 
 # Global settings instance
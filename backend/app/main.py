@@ -1,18 +1,22 @@
 """FastAPI application entry point."""
 
 import os
+from typing import Optional
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 
 from app.routers import pipeline, export, auth
-from app.config import settings
+from app.config import settings, ANGLE_OPTIONS, CLIENT_OPTIONS
+from app.services.workers import start_pool, shutdown_pool
 
 app = FastAPI(
     title="VANHA Creative Auto-Namer",
     description="Analyze ad assets, group them, and generate standardized filenames",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware for frontend - allow configured origins plus localhost for dev
@@ -41,6 +45,19 @@ settings.temp_dir.mkdir(parents=True, exist_ok=True)
 # Mount temp directory for serving thumbnails/frames
 app.mount("/temp", StaticFiles(directory=str(settings.temp_dir)), name="temp")
 
+
+@app.on_event("startup")
+async def startup():
+    """Start the worker pool used for per-asset processing."""
+    start_pool()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Stop the worker pool."""
+    shutdown_pool()
+
+
 # Include routers
 app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
 app.include_router(pipeline.router, prefix="/api", tags=["pipeline"])
@@ -53,15 +70,35 @@ async def root():
     return {"status": "ok", "app": "VANHA Creative Auto-Namer"}
 
 
+# Cached /api/config payload as (day, payload); only the default date
+# changes, so it is rebuilt at most once per day
+_config_cache: Optional[tuple[str, dict]] = None
+
+
 @app.get("/api/config")
 async def get_config():
     """Get application configuration defaults."""
-    from app.config import ANGLE_OPTIONS, CLIENT_OPTIONS
+    global _config_cache
+    
+    today = settings.get_default_date()
+    if _config_cache is not None and _config_cache[0] == today:
+        return _config_cache[1]
     
-    return {
+    payload = {
         "default_campaign": "",  # Blank by default
-        "default_date": settings.get_default_date(),
+        "default_date": today,
         "default_start_number": settings.default_start_number,
         "angle_options": ANGLE_OPTIONS,
         "client_options": CLIENT_OPTIONS,
     }
+    _config_cache = (today, payload)
+    return payload
+
+
+if __name__ == "__main__":
+    import sys
+    import uvicorn
+    
+    # uvloop is not available on Windows
+    loop = "auto" if sys.platform == "win32" else "uvloop"
+    uvicorn.run("app.main:app", loop=loop, http="httptools")
@@ -33,7 +33,7 @@ class UserInputs(BaseModel):
 
 class AdGroup(BaseModel):
     """A group of assets that form a single ad."""
-    id: str
+    id: str  # uuid4 hex (32 chars, no dashes)
     group_type: GroupType
     assets: list[ProcessedAsset]
     
@@ -2,10 +2,10 @@
 
 from typing import Optional
 from fastapi import APIRouter, HTTPException, Cookie
-from fastapi.responses import Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 
-from app.services.exporter import export_to_csv
+from app.services.exporter import iter_csv_snapshot, iter_export_rows, iter_preview_rows
 from app.routers import pipeline
 from app.routers.auth import get_credentials_from_session
 
@@ -21,15 +21,16 @@ class RenameResult(BaseModel):
 
 
 @router.post("/export")
-async def export_csv():
+async def export_csv(analysis_id: Optional[str] = None):
     """Export current groups to CSV."""
-    if pipeline._current_groups is None:
+    session = pipeline.get_session(analysis_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="No analysis results. Run /analyze first.")
     
-    csv_content = export_to_csv(pipeline._current_groups.groups)
-    
-    return Response(
-        content=csv_content,
+    # Snapshot the rows before streaming: chunks are produced in a worker
+    # thread, and edits handled in between must not leak into the export
+    return StreamingResponse(
+        iter_csv_snapshot(session.groups.groups),
         media_type="text/csv",
         headers={
             "Content-Disposition": "attachment; filename=ad_names.csv"
@@ -38,19 +39,19 @@ async def export_csv():
 
 
 @router.get("/export/preview")
-async def preview_export():
+async def preview_export(analysis_id: Optional[str] = None):
     """Preview export data without downloading."""
-    if pipeline._current_groups is None:
+    session = pipeline.get_session(analysis_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="No analysis results. Run /analyze first.")
     
-    from app.services.exporter import generate_export_rows
-    rows = generate_export_rows(pipeline._current_groups.groups)
-    
-    return {"rows": [row.model_dump() for row in rows]}
+    # Rows are plain str/float dicts, so they go straight to orjson
+    return ORJSONResponse({"rows": list(iter_preview_rows(session.groups.groups))})
 
 
 @router.post("/export/rename")
 async def rename_files_in_drive(
+    analysis_id: Optional[str] = None,
     session_id: Optional[str] = Cookie(default=None)
 ) -> dict:
     """Rename all files in Google Drive to their new names.
@@ -58,10 +59,11 @@ async def rename_files_in_drive(
     This applies the generated filenames to the actual files in Drive.
     Only works when the source is Google Drive.
     """
-    if pipeline._current_groups is None:
+    session = pipeline.get_session_for_update(analysis_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="No analysis results. Run /analyze first.")
     
-    if pipeline._current_source is None:
+    if session.source is None:
         raise HTTPException(
             status_code=400, 
             detail="Rename only works with Google Drive sources. For local files, use the CSV export."
@@ -74,36 +76,18 @@ async def rename_files_in_drive(
     
     results: list[RenameResult] = []
     
-    # Generate new filenames for each asset
-    from app.services.exporter import generate_export_rows
-    export_rows = generate_export_rows(pipeline._current_groups.groups)
+    # Snapshot each asset's new filename before the first await, so edits
+    # made while renames are in flight can't change the rows mid-loop.
+    # Rows carry the Drive file ID, so no lookup by old name is needed.
+    rows = list(iter_export_rows(session.groups.groups))
     
-    for row in export_rows:
+    for row in rows:
         old_name = row.old_name
         new_name = row.new_name
         
-        # Find the asset to get its Drive file ID
-        file_id = None
-        for group in pipeline._current_groups.groups:
-            for asset in group.assets:
-                if asset.asset.name == old_name:
-                    file_id = asset.asset.id
-                    break
-            if file_id:
-                break
-        
-        if not file_id:
-            results.append(RenameResult(
-                old_name=old_name,
-                new_name=new_name,
-                success=False,
-                error="File not found in current analysis"
-            ))
-            continue
-        
         try:
             # Rename the file in Drive
-            await pipeline._current_source.rename_file(file_id, new_name)
+            await session.source.rename_file(row.file_id, new_name)
             results.append(RenameResult(
                 old_name=old_name,
                 new_name=new_name,
@@ -1,14 +1,21 @@
 """Pipeline API routes for analyzing assets."""
 
+import asyncio
+import hashlib
+import os
 import uuid
+from collections import OrderedDict
+from itertools import chain
+from operator import itemgetter
 from typing import Optional
 from fastapi import APIRouter, HTTPException, Cookie, Response
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 import io
 
-from app.models.asset import AssetType, ProcessedAsset
+from app.models.asset import Asset, AssetType, ProcessedAsset
 from app.models.group import AdGroup, GroupedAssets, UserInputs, ConfidenceScores, GroupType
+from app.services.source.base import AssetSource
 from app.services.source.local import LocalFolderSource
 from app.services.source.google_drive import GoogleDriveSource, create_drive_source
 from app.services.metadata import extract_metadata
@@ -18,14 +25,65 @@ from app.services.fingerprint import compute_fingerprint
 from app.services.grouper import group_assets, sort_assets_by_filename_number
 from app.services.inference import infer_fields
 from app.routers.auth import get_credentials_from_session
-from app.config import COPY_DOC_TEMPLATES
+from app.config import settings, COPY_DOC_TEMPLATES
 
 router = APIRouter()
 
-# In-memory storage for current session
-_current_groups: Optional[GroupedAssets] = None
-_current_inputs: Optional[UserInputs] = None
-_current_source: Optional[GoogleDriveSource] = None  # Keep reference for Drive operations
+
+class AnalysisSession:
+    """In-memory state for a single /analyze run."""
+    
+    def __init__(
+        self,
+        groups: GroupedAssets,
+        inputs: UserInputs,
+        source: Optional[GoogleDriveSource] = None,
+    ):
+        """Initialize a session and index its groups.
+        
+        Args:
+            groups: The grouped assets produced by the pipeline.
+            inputs: The user inputs the analysis was run with.
+            source: Drive source, kept for later Drive operations (None for local folders).
+        """
+        self.groups = groups
+        self.inputs = inputs
+        self.source = source
+        
+        # Lookup indexes over groups, kept in sync by the mutation endpoints
+        self.group_index: dict[str, AdGroup] = {}
+        self.asset_index: dict[str, tuple[AdGroup, int]] = {}  # asset id -> (group, position)
+        self.rebuild_indexes()
+    
+    def index_group(self, group: AdGroup) -> None:
+        """Add a group and the positions of its assets to the lookup indexes."""
+        self.group_index[group.id] = group
+        for i, asset in enumerate(group.assets):
+            self.asset_index[asset.asset.id] = (group, i)
+    
+    def rebuild_indexes(self) -> None:
+        """Rebuild the lookup indexes from groups."""
+        self.group_index.clear()
+        self.asset_index.clear()
+        for group in self.groups.groups:
+            self.index_group(group)
+
+
+# In-memory analysis sessions keyed by analysis id, least recently used first.
+# Each /analyze run gets its own session so concurrent analyses don't
+# overwrite each other.
+_MAX_SESSIONS = 16
+_sessions: OrderedDict[str, AnalysisSession] = OrderedDict()
+
+# Pristine results of recent local analyses, keyed by folder fingerprint and
+# the inputs that shape the output. Sessions get deep copies, so edits made
+# through the other endpoints never leak back into the cache.
+_MAX_CACHED_ANALYSES = 16
+_analyze_cache: OrderedDict[tuple, GroupedAssets] = OrderedDict()
+
+# String fields that bulk replace/apply can set directly (offer is handled as a bool)
+_BULK_STR_FIELDS = ("product", "angle", "hook", "creator", "campaign")
+_BOOL_TRUE = {"yes", "true", "1"}
 
 
 class AnalyzeRequest(BaseModel):
@@ -94,6 +152,75 @@ class ReorderAssetRequest(BaseModel):
     new_index: int
 
 
+def get_session(analysis_id: Optional[str] = None) -> Optional[AnalysisSession]:
+    """Look up an analysis session.
+    
+    Args:
+        analysis_id: Id returned by /analyze. When omitted, the most recently
+            used session is returned so older clients keep working; this
+            fallback is for read-only endpoints (see get_session_for_update).
+        
+    Returns:
+        The session, or None if there is no matching analysis.
+    """
+    if analysis_id is None:
+        return next(reversed(_sessions.values()), None)
+    
+    session = _sessions.get(analysis_id)
+    if session is not None:
+        _sessions.move_to_end(analysis_id)
+    return session
+
+
+def get_session_for_update(analysis_id: Optional[str]) -> Optional[AnalysisSession]:
+    """Look up the analysis session a mutating request targets.
+    
+    Unlike get_session there is no most-recently-used fallback, so an edit
+    can never land on someone else's analysis.
+    
+    Args:
+        analysis_id: Id returned by /analyze.
+        
+    Returns:
+        The session, or None if there is no matching analysis.
+        
+    Raises:
+        HTTPException: 400 if analysis_id is missing.
+    """
+    if analysis_id is None:
+        raise HTTPException(status_code=400, detail="analysis_id is required")
+    return get_session(analysis_id)
+
+
+def _store_session(session: AnalysisSession) -> str:
+    """Store a new session, evicting the oldest beyond _MAX_SESSIONS.
+    
+    Returns:
+        The new analysis id.
+    """
+    analysis_id = uuid.uuid4().hex
+    _sessions[analysis_id] = session
+    while len(_sessions) > _MAX_SESSIONS:
+        _sessions.popitem(last=False)
+    return analysis_id
+
+
+def _all_square(assets: list[ProcessedAsset]) -> bool:
+    """Check whether every asset is (roughly) 1:1, as carousel cards are."""
+    ratios = [a.metadata.aspect_ratio for a in assets]
+    return not ratios or (min(ratios) >= 0.95 and max(ratios) <= 1.05)
+
+
+def _grouped_response(grouped: GroupedAssets) -> ORJSONResponse:
+    """Serialize GroupedAssets straight to JSON.
+    
+    The model is already valid, so this skips FastAPI's response-model
+    re-validation and serializes with orjson instead of stdlib json.
+    Request bodies are still validated as usual.
+    """
+    return ORJSONResponse(content=grouped.model_dump(mode="json"))
+
+
 def _is_drive_url(path: str) -> bool:
     """Check if the path is a Google Drive URL or folder ID."""
     return "drive.google.com" in path or (
@@ -104,11 +231,52 @@ def _is_drive_url(path: str) -> bool:
     )
 
 
+async def _process_one(asset: Asset, source: AssetSource, sem: asyncio.Semaphore) -> ProcessedAsset:
+    """Run metadata, frame, OCR and fingerprint extraction for a single asset."""
+    async with sem:
+        # For Drive sources, download to local temp first
+        if asset.path.startswith("drive://"):
+            local_path = await source.get_asset_path(asset.id)
+            # Create a copy of the asset with the local path for processing
+            local_asset = Asset(
+                id=asset.id,
+                name=asset.name,
+                asset_type=asset.asset_type,
+                path=local_path,
+            )
+        else:
+            local_asset = asset
+        
+        # Extract metadata using local path
+        metadata = await extract_metadata(local_asset)
+        placement = metadata.placement
+        
+        # Extract frames for videos
+        frame_paths = []
+        if local_asset.asset_type == AssetType.VIDEO:
+            frame_paths = await extract_frames(local_asset, duration=metadata.duration)
+        
+        # Run OCR
+        ocr_text = await extract_text(local_asset, frame_paths)
+        
+        # Compute fingerprint
+        fingerprint = await compute_fingerprint(local_asset, frame_paths)
+        
+        return ProcessedAsset(
+            asset=asset,
+            metadata=metadata,
+            placement=placement,
+            ocr_text=ocr_text,
+            fingerprint=fingerprint,
+            frame_paths=frame_paths,
+        )
+
+
 @router.post("/analyze")
 async def analyze_assets(
     request: AnalyzeRequest,
     session_id: Optional[str] = Cookie(default=None)
-) -> GroupedAssets:
+):
     """Analyze assets in a folder and group them.
     
     This runs the full pipeline:
@@ -119,8 +287,11 @@ async def analyze_assets(
     5. Compute fingerprints
     6. Group assets
     7. Infer fields
+    
+    Returns the grouped assets plus an ``analysis_id`` that later requests
+    pass to address this analysis.
     """
-    global _current_groups, _current_inputs, _current_source
+    drive_source: Optional[GoogleDriveSource] = None
     
     try:
         # Determine source type
@@ -137,13 +308,12 @@ async def analyze_assets(
                 )
             print(f"[DEBUG] Got credentials, creating Drive source")
             source = create_drive_source(request.folder_path, credentials)
-            _current_source = source  # Keep reference for later operations
+            drive_source = source  # Keep reference for later operations
             print(f"[DEBUG] Drive source created for folder: {source.folder_id}")
         else:
             # Local folder source
             print(f"[DEBUG] Creating local source for: {request.folder_path}")
             source = LocalFolderSource(request.folder_path)
-            _current_source = None
     except ValueError as e:
         print(f"[DEBUG] ValueError: {e}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -152,7 +322,7 @@ async def analyze_assets(
         raise HTTPException(status_code=500, detail=f"Failed to access folder: {str(e)}")
     
     # Store inputs
-    _current_inputs = UserInputs(
+    inputs = UserInputs(
         client=request.client,
         campaign=request.campaign,
         start_number=request.start_number,
@@ -166,111 +336,98 @@ async def analyze_assets(
     if not assets:
         raise HTTPException(status_code=400, detail="No assets found in folder")
     
-    # 2-5. Process each asset
-    processed_assets: list[ProcessedAsset] = []
-    
-    for asset in assets:
-        # For Drive sources, download to local temp first
-        if asset.path.startswith("drive://"):
-            local_path = await source.get_asset_path(asset.id)
-            # Create a copy of the asset with the local path for processing
-            from app.models.asset import Asset
-            local_asset = Asset(
-                id=asset.id,
-                name=asset.name,
-                asset_type=asset.asset_type,
-                path=local_path,
-            )
-        else:
-            local_asset = asset
-        
-        # Extract metadata using local path
-        metadata = await extract_metadata(local_asset)
-        placement = metadata.placement
-        
-        # Extract frames for videos
-        frame_paths = []
-        if local_asset.asset_type == AssetType.VIDEO:
-            frame_paths = await extract_frames(local_asset)
-        
-        # Run OCR
-        ocr_text = await extract_text(local_asset, frame_paths)
-        
-        # Compute fingerprint
-        fingerprint = await compute_fingerprint(local_asset, frame_paths)
-        
-        # Get thumbnail URL
-        thumbnail_url = await source.get_thumbnail_url(asset.id)
-        
-        processed = ProcessedAsset(
-            asset=asset,
-            metadata=metadata,
-            placement=placement,
-            ocr_text=ocr_text,
-            fingerprint=fingerprint,
-            frame_paths=frame_paths,
-            thumbnail_url=thumbnail_url,
+    # Unchanged local folder with the same inputs: reuse the previous result
+    cache_key = None
+    if drive_source is None:
+        cache_key = (
+            _folder_fingerprint(assets),
+            request.client,
+            request.campaign or settings.get_default_campaign(),
+            request.start_number,
+            request.date or settings.get_default_date(),
         )
-        processed_assets.append(processed)
+        cached = _analyze_cache.get(cache_key)
+        if cached is not None:
+            _analyze_cache.move_to_end(cache_key)
+            print(f"[DEBUG] Folder unchanged, reusing cached analysis")
+            return _analysis_response(cached.model_copy(deep=True), inputs, drive_source)
+    
+    # 2-5. Process assets concurrently, bounded so we don't spawn
+    # an unbounded number of ffmpeg/tesseract processes at once
+    sem = asyncio.Semaphore(os.cpu_count() or 4)
+    processed_assets: list[ProcessedAsset] = list(
+        await asyncio.gather(*[_process_one(asset, source, sem) for asset in assets])
+    )
+    
+    # Thumbnails in one batch, once video frames have been extracted
+    thumb_urls = await source.get_thumbnail_urls([a.id for a in assets])
+    for processed in processed_assets:
+        processed.thumbnail_url = thumb_urls.get(processed.asset.id)
     
     # 6. Group assets
-    grouped = await group_assets(processed_assets, _current_inputs)
+    grouped = await group_assets(processed_assets, inputs)
     
     # 7. Infer fields for each group
-    for i, group in enumerate(grouped.groups):
-        grouped.groups[i] = await infer_fields(group)
+    grouped.groups = list(await asyncio.gather(*[infer_fields(g) for g in grouped.groups]))
+    
+    if cache_key is not None:
+        _analyze_cache[cache_key] = grouped.model_copy(deep=True)
+        while len(_analyze_cache) > _MAX_CACHED_ANALYSES:
+            _analyze_cache.popitem(last=False)
     
-    # Store results
-    _current_groups = grouped
+    return _analysis_response(grouped, inputs, drive_source)
+
+
+def _folder_fingerprint(assets: list[Asset]) -> str:
+    """Hash the paths, modification times and sizes of local assets.
+    
+    Args:
+        assets: Assets listed from a local folder.
+    
+    Returns:
+        Hex digest that changes whenever a file is added, removed or modified.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for asset in sorted(assets, key=lambda a: a.path):
+        st = os.stat(asset.path)
+        h.update(f"{asset.path}:{st.st_mtime_ns}:{st.st_size}|".encode())
+    return h.hexdigest()
+
+
+def _analysis_response(
+    grouped: GroupedAssets,
+    inputs: UserInputs,
+    drive_source: Optional[GoogleDriveSource],
+) -> ORJSONResponse:
+    """Store an analysis as a new session and build the /analyze response."""
+    analysis_id = _store_session(AnalysisSession(grouped, inputs, drive_source))
     
-    return grouped
+    content = grouped.model_dump(mode="json")
+    content["analysis_id"] = analysis_id
+    return ORJSONResponse(content=content)
 
 
 @router.get("/debug/analysis")
-async def debug_analysis():
+async def debug_analysis(analysis_id: Optional[str] = None):
     """Debug endpoint showing detailed analysis breakdown."""
-    if _current_groups is None:
+    session = get_session(analysis_id)
+    if session is None:
         return {"error": "No analysis results. Run /analyze first."}
     
-    # Build detailed breakdown
-    assets_breakdown = []
-    for group in _current_groups.groups:
-        for asset in group.assets:
-            assets_breakdown.append({
-                "filename": asset.asset.name,
-                "type": asset.asset.asset_type,
-                "dimensions": f"{asset.metadata.width}x{asset.metadata.height}",
-                "aspect_ratio": round(asset.metadata.aspect_ratio, 4),
-                "placement": asset.placement,
-                "group_id": group.id[:8],
-                "group_type": group.group_type,
-                "ad_number": group.ad_number,
-                "fingerprint": asset.fingerprint[:16] if asset.fingerprint else "none",
-                "ocr_preview": asset.ocr_text[:50] if asset.ocr_text else "none",
-            })
-    
-    # Ungrouped assets
-    for asset in _current_groups.ungrouped:
-        assets_breakdown.append({
-            "filename": asset.asset.name,
-            "type": asset.asset.asset_type,
-            "dimensions": f"{asset.metadata.width}x{asset.metadata.height}",
-            "aspect_ratio": round(asset.metadata.aspect_ratio, 4),
-            "placement": asset.placement,
-            "group_id": "UNGROUPED",
-            "group_type": "none",
-            "ad_number": None,
-            "fingerprint": asset.fingerprint[:16] if asset.fingerprint else "none",
-            "ocr_preview": asset.ocr_text[:50] if asset.ocr_text else "none",
-        })
-    
-    # Sort by filename
-    assets_breakdown.sort(key=lambda x: x["filename"])
+    # Build detailed breakdown, sorted by filename
+    groups = session.groups.groups
+    assets_breakdown = sorted(
+        chain(
+            (_asset_row(asset, group) for group in groups for asset in group.assets),
+            (_asset_row(asset) for asset in session.groups.ungrouped),
+        ),
+        key=itemgetter("filename"),
+    )
     
-    return {
+    return ORJSONResponse({
         "total_assets": len(assets_breakdown),
-        "total_groups": len(_current_groups.groups),
-        "ungrouped_count": len(_current_groups.ungrouped),
+        "total_groups": len(groups),
+        "ungrouped_count": len(session.groups.ungrouped),
         "groups_summary": [
             {
                 "ad_number": g.ad_number,
@@ -279,32 +436,47 @@ async def debug_analysis():
                 "asset_count": len(g.assets),
                 "assets": [a.asset.name for a in g.assets],
             }
-            for g in _current_groups.groups
+            for g in groups
         ],
         "assets_breakdown": assets_breakdown,
+    })
+
+
+def _asset_row(asset: ProcessedAsset, group: Optional[AdGroup] = None) -> dict:
+    """Build a debug breakdown row for an asset (group is None if ungrouped)."""
+    return {
+        "filename": asset.asset.name,
+        "type": asset.asset.asset_type,
+        "dimensions": f"{asset.metadata.width}x{asset.metadata.height}",
+        "aspect_ratio": round(asset.metadata.aspect_ratio, 4),
+        "placement": asset.placement,
+        "group_id": group.id[:8] if group else "UNGROUPED",
+        "group_type": group.group_type if group else "none",
+        "ad_number": group.ad_number if group else None,
+        "fingerprint": asset.fingerprint[:16] if asset.fingerprint else "none",
+        "ocr_preview": asset.ocr_text[:50] if asset.ocr_text else "none",
     }
 
 
 @router.get("/groups")
-async def get_groups() -> GroupedAssets:
+async def get_groups(analysis_id: Optional[str] = None):
     """Get current grouped assets."""
-    global _current_groups
-    
-    if _current_groups is None:
+    session = get_session(analysis_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="No analysis results. Run /analyze first.")
     
-    return _current_groups
+    return _grouped_response(session.groups)
 
 
 @router.get("/drive/thumbnail/{file_id}")
 async def get_drive_thumbnail(
     file_id: str,
+    analysis_id: Optional[str] = None,
     session_id: Optional[str] = Cookie(default=None)
 ):
     """Proxy Drive thumbnails (requires auth)."""
-    global _current_source
-    
-    if _current_source is None:
+    session = get_session(analysis_id)
+    if session is None or session.source is None:
         raise HTTPException(status_code=404, detail="No Drive source available")
     
     credentials = get_credentials_from_session(session_id)
@@ -313,10 +485,10 @@ async def get_drive_thumbnail(
     
     try:
         # Get thumbnail bytes from Drive
-        data = await _current_source.get_asset_bytes(file_id)
+        data = await session.source.get_asset_bytes(file_id)
         
         # Detect content type from file info
-        file_info = await _current_source.get_file_info(file_id)
+        file_info = await session.source.get_file_info(file_id)
         content_type = file_info.get("mimeType", "image/jpeg")
         
         return StreamingResponse(
@@ -329,67 +501,47 @@ async def get_drive_thumbnail(
 
 # NOTE: These specific routes MUST come before /groups/{group_id} to avoid path conflicts
 @router.put("/groups/renumber")
-async def renumber_groups(request: RenumberRequest) -> GroupedAssets:
+async def renumber_groups(request: RenumberRequest, analysis_id: Optional[str] = None):
     """Renumber all groups starting from a given number."""
-    global _current_groups
-    
-    if _current_groups is None:
+    session = get_session_for_update(analysis_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="No analysis results.")
     
     # Renumber all groups sequentially
-    for i, group in enumerate(_current_groups.groups):
+    for i, group in enumerate(session.groups.groups):
         group.ad_number = request.start_number + i
     
-    return _current_groups
+    return _grouped_response(session.groups)
 
 
 @router.put("/groups/regroup")
-async def regroup_asset(request: RegroupRequest) -> GroupedAssets:
+async def regroup_asset(request: RegroupRequest, analysis_id: Optional[str] = None):
     """Move an asset from one group to another or create a new group."""
-    global _current_groups, _current_inputs
-    
-    if _current_groups is None:
+    session = get_session_for_update(analysis_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="No analysis results.")
     
     # Find the asset and its current group
-    source_group = None
-    asset_to_move = None
-    asset_index = -1
-    
-    for group in _current_groups.groups:
-        for i, asset in enumerate(group.assets):
-            if asset.asset.id == request.asset_id:
-                source_group = group
-                asset_to_move = asset
-                asset_index = i
-                break
-        if source_group:
-            break
-    
-    if not source_group or not asset_to_move:
+    if request.asset_id not in session.asset_index:
         raise HTTPException(status_code=404, detail=f"Asset not found: {request.asset_id}")
-    
-    # Remove asset from source group
-    source_group.assets.pop(asset_index)
+    source_group, asset_index = session.asset_index[request.asset_id]
     
     # Determine target group
+    target_group = None
     if request.target_group_id:
-        # Move to existing group
-        target_group = None
-        for group in _current_groups.groups:
-            if group.id == request.target_group_id:
-                target_group = group
-                break
-        
+        target_group = session.group_index.get(request.target_group_id)
         if not target_group:
             raise HTTPException(status_code=404, detail=f"Target group not found: {request.target_group_id}")
         
         # Don't move to same group
         if target_group.id == source_group.id:
-            # Put asset back
-            source_group.assets.insert(asset_index, asset_to_move)
-            return _current_groups
-        
+            return _grouped_response(session.groups)
+    
+    # Remove asset from source group
+    asset_to_move = source_group.assets.pop(asset_index)
+    
+    if target_group:
+        # Move to existing group
         # Add asset to target group at specified position
         if request.destination_index is not None:
             # Insert at the specific position user dropped it
@@ -401,8 +553,7 @@ async def regroup_asset(request: RegroupRequest) -> GroupedAssets:
         
         # Update target group type if needed (e.g., becomes carousel with 3+ assets)
         if len(target_group.assets) >= 3:
-            all_square = all(0.95 <= a.metadata.aspect_ratio <= 1.05 for a in target_group.assets)
-            if all_square:
+            if _all_square(target_group.assets):
                 target_group.group_type = GroupType.CAROUSEL
         elif len(target_group.assets) == 2:
             target_group.group_type = GroupType.STANDARD
@@ -410,27 +561,28 @@ async def regroup_asset(request: RegroupRequest) -> GroupedAssets:
             target_group.group_type = GroupType.SINGLE
     else:
         # Create new group for this asset
-        campaign = _current_inputs.campaign or "Campaign"
-        date = _current_inputs.date or ""
+        campaign = session.inputs.campaign or "Campaign"
+        date = session.inputs.date or ""
         
         new_group = AdGroup(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,
             group_type=GroupType.SINGLE,
             assets=[asset_to_move],
             ad_number=0,  # Will be renumbered
             campaign=campaign,
             date=date,
         )
-        _current_groups.groups.append(new_group)
+        session.groups.groups.append(new_group)
+        target_group = new_group
     
     # Remove source group if empty
     if len(source_group.assets) == 0:
-        _current_groups.groups = [g for g in _current_groups.groups if g.id != source_group.id]
+        session.groups.groups.remove(source_group)
+        del session.group_index[source_group.id]
     else:
         # Update source group type
         if len(source_group.assets) >= 3:
-            all_square = all(0.95 <= a.metadata.aspect_ratio <= 1.05 for a in source_group.assets)
-            if all_square:
+            if _all_square(source_group.assets):
                 source_group.group_type = GroupType.CAROUSEL
                 # Re-sort carousel assets by filename number for proper card ordering
                 source_group.assets = sort_assets_by_filename_number(source_group.assets)
@@ -440,179 +592,152 @@ async def regroup_asset(request: RegroupRequest) -> GroupedAssets:
             source_group.group_type = GroupType.STANDARD
         else:
             source_group.group_type = GroupType.SINGLE
+        session.index_group(source_group)
+    session.index_group(target_group)
     
     # Renumber all groups sequentially, preserving user's current starting number
     # Use the minimum ad_number from existing groups (excluding newly created groups with ad_number=0)
-    existing_numbers = [g.ad_number for g in _current_groups.groups if g.ad_number > 0]
-    start_num = min(existing_numbers) if existing_numbers else (_current_inputs.start_number if _current_inputs else 1)
+    existing_numbers = [g.ad_number for g in session.groups.groups if g.ad_number > 0]
+    start_num = min(existing_numbers) if existing_numbers else session.inputs.start_number
     
-    for i, group in enumerate(_current_groups.groups):
+    for i, group in enumerate(session.groups.groups):
         group.ad_number = start_num + i
     
-    return _current_groups
+    return _grouped_response(session.groups)
 
 
 @router.put("/groups/{group_id}")
-async def update_group(group_id: str, request: UpdateGroupRequest) -> AdGroup:
+async def update_group(
+    group_id: str,
+    request: UpdateGroupRequest,
+    analysis_id: Optional[str] = None,
+) -> AdGroup:
     """Update a group's editable fields."""
-    global _current_groups
-    
-    if _current_groups is None:
+    session = get_session_for_update(analysis_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="No analysis results.")
     
     # Find the group
-    for group in _current_groups.groups:
-        if group.id == group_id:
-            if request.product is not None:
-                group.product = request.product
-            if request.angle is not None:
-                group.angle = request.angle
-            if request.hook is not None:
-                group.hook = request.hook
-            if request.creator is not None:
-                group.creator = request.creator
-            if request.offer is not None:
-                group.offer = request.offer
-            if request.campaign is not None:
-                group.campaign = request.campaign
-            # Copy fields
-            if request.primary_text is not None:
-                group.primary_text = request.primary_text
-            if request.headline is not None:
-                group.headline = request.headline
-            if request.description is not None:
-                group.description = request.description
-            if request.cta is not None:
-                group.cta = request.cta
-            if request.url is not None:
-                group.url = request.url
-            if request.comment_media_buyer is not None:
-                group.comment_media_buyer = request.comment_media_buyer
-            if request.comment_client is not None:
-                group.comment_client = request.comment_client
-            return group
-    
-    raise HTTPException(status_code=404, detail=f"Group not found: {group_id}")
+    group = session.group_index.get(group_id)
+    if group is None:
+        raise HTTPException(status_code=404, detail=f"Group not found: {group_id}")
+    
+    # Only apply fields the client actually sent. Group fields are not
+    # nullable, so explicit nulls are ignored rather than stored.
+    updates = request.model_dump(exclude_unset=True, exclude_none=True)
+    for field, value in updates.items():
+        setattr(group, field, value)
+    return group
 
 
 @router.put("/groups/{group_id}/assets/{asset_id:path}")
-async def update_asset(group_id: str, asset_id: str, request: UpdateAssetRequest) -> ProcessedAsset:
+async def update_asset(
+    group_id: str,
+    asset_id: str,
+    request: UpdateAssetRequest,
+    analysis_id: Optional[str] = None,
+) -> ProcessedAsset:
     """Update per-asset fields (headline/description/custom_filename)."""
-    global _current_groups
-    
-    if _current_groups is None:
+    session = get_session_for_update(analysis_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="No analysis results.")
     
     # Find the group and asset
-    for group in _current_groups.groups:
-        if group.id == group_id:
-            for i, asset in enumerate(group.assets):
-                if asset.asset.id == asset_id:
-                    if request.headline is not None:
-                        group.assets[i].headline = request.headline
-                    if request.description is not None:
-                        group.assets[i].description = request.description
-                    if request.custom_filename is not None:
-                        # Empty string clears the override, use generated name
-                        group.assets[i].custom_filename = request.custom_filename if request.custom_filename else None
-                    return group.assets[i]
-            raise HTTPException(status_code=404, detail=f"Asset not found: {asset_id}")
-    
-    raise HTTPException(status_code=404, detail=f"Group not found: {group_id}")
+    if group_id not in session.group_index:
+        raise HTTPException(status_code=404, detail=f"Group not found: {group_id}")
+    
+    group, i = session.asset_index.get(asset_id, (None, -1))
+    if group is None or group.id != group_id:
+        raise HTTPException(status_code=404, detail=f"Asset not found: {asset_id}")
+    
+    updates = request.model_dump(exclude_unset=True, exclude_none=True)
+    if "custom_filename" in request.model_fields_set:
+        # Empty string or null clears the override, use generated name
+        updates["custom_filename"] = request.custom_filename or None
+    
+    asset = group.assets[i]
+    for field, value in updates.items():
+        setattr(asset, field, value)
+    return asset
 
 
 @router.put("/groups/{group_id}/reorder")
-async def reorder_asset(group_id: str, request: ReorderAssetRequest) -> AdGroup:
+async def reorder_asset(
+    group_id: str,
+    request: ReorderAssetRequest,
+    analysis_id: Optional[str] = None,
+) -> AdGroup:
     """Reorder an asset within a group (e.g., change carousel card order)."""
-    global _current_groups
-    
-    if _current_groups is None:
+    session = get_session_for_update(analysis_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="No analysis results.")
     
     # Find the group
-    for group in _current_groups.groups:
-        if group.id == group_id:
-            # Find the asset's current index
-            current_index = None
-            for i, asset in enumerate(group.assets):
-                if asset.asset.id == request.asset_id:
-                    current_index = i
-                    break
-            
-            if current_index is None:
-                raise HTTPException(status_code=404, detail=f"Asset not found: {request.asset_id}")
-            
-            # Validate new index
-            if request.new_index < 0 or request.new_index >= len(group.assets):
-                raise HTTPException(status_code=400, detail=f"Invalid index: {request.new_index}")
-            
-            # Reorder: remove from current position and insert at new position
-            asset = group.assets.pop(current_index)
-            group.assets.insert(request.new_index, asset)
-            
-            return group
-    
-    raise HTTPException(status_code=404, detail=f"Group not found: {group_id}")
+    group = session.group_index.get(group_id)
+    if group is None:
+        raise HTTPException(status_code=404, detail=f"Group not found: {group_id}")
+    
+    # Find the asset's current index
+    owner, current_index = session.asset_index.get(request.asset_id, (None, -1))
+    if owner is not group:
+        raise HTTPException(status_code=404, detail=f"Asset not found: {request.asset_id}")
+    
+    # Validate new index
+    if request.new_index < 0 or request.new_index >= len(group.assets):
+        raise HTTPException(status_code=400, detail=f"Invalid index: {request.new_index}")
+    
+    # Reorder: remove from current position and insert at new position
+    asset = group.assets.pop(current_index)
+    group.assets.insert(request.new_index, asset)
+    session.index_group(group)
+    
+    return group
 
 
 @router.post("/bulk/replace")
-async def bulk_replace(request: BulkReplaceRequest) -> GroupedAssets:
+async def bulk_replace(request: BulkReplaceRequest, analysis_id: Optional[str] = None):
     """Find and replace a field value across all groups."""
-    global _current_groups
-    
-    if _current_groups is None:
+    session = get_session_for_update(analysis_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="No analysis results.")
     
-    for group in _current_groups.groups:
-        if request.field == "product":
-            if group.product == request.find:
-                group.product = request.replace
-        elif request.field == "angle":
-            if group.angle == request.find:
-                group.angle = request.replace
-        elif request.field == "hook":
-            if group.hook == request.find:
-                group.hook = request.replace
-        elif request.field == "creator":
-            if group.creator == request.find:
-                group.creator = request.replace
-        elif request.field == "campaign":
-            if group.campaign == request.find:
-                group.campaign = request.replace
-        elif request.field == "offer":
-            # Handle offer as boolean
-            find_bool = request.find.lower() in ("yes", "true", "1")
-            replace_bool = request.replace.lower() in ("yes", "true", "1")
+    field = request.field
+    if field in _BULK_STR_FIELDS:
+        for group in session.groups.groups:
+            if getattr(group, field) == request.find:
+                setattr(group, field, request.replace)
+    elif field == "offer":
+        # Handle offer as boolean
+        find_bool = request.find.lower() in _BOOL_TRUE
+        replace_bool = request.replace.lower() in _BOOL_TRUE
+        for group in session.groups.groups:
             if group.offer == find_bool:
                 group.offer = replace_bool
     
-    return _current_groups
+    return _grouped_response(session.groups)
 
 
 @router.post("/bulk/apply")
-async def bulk_apply(request: BulkApplyRequest) -> GroupedAssets:
+async def bulk_apply(request: BulkApplyRequest, analysis_id: Optional[str] = None):
     """Apply a field value to selected groups."""
-    global _current_groups
-    
-    if _current_groups is None:
+    session = get_session_for_update(analysis_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="No analysis results.")
     
-    for group in _current_groups.groups:
-        if group.id in request.group_ids:
-            if request.field == "product":
-                group.product = request.value
-            elif request.field == "angle":
-                group.angle = request.value
-            elif request.field == "hook":
-                group.hook = request.value
-            elif request.field == "creator":
-                group.creator = request.value
-            elif request.field == "campaign":
-                group.campaign = request.value
-            elif request.field == "offer":
-                group.offer = request.value.lower() in ("yes", "true", "1")
+    field = request.field
+    if field in _BULK_STR_FIELDS:
+        value = request.value
+    elif field == "offer":
+        value = request.value.lower() in _BOOL_TRUE
+    else:
+        return _grouped_response(session.groups)
+    
+    for group_id in request.group_ids:
+        group = session.group_index.get(group_id)
+        if group is not None:
+            setattr(group, field, value)
     
-    return _current_groups
+    return _grouped_response(session.groups)
 
 
 class CopyDocRequest(BaseModel):
@@ -663,11 +788,10 @@ async def get_copy_doc_templates(
 @router.post("/copy-doc")
 async def copy_doc_to_folder(
     request: CopyDocRequest,
+    analysis_id: Optional[str] = None,
     session_id: Optional[str] = Cookie(default=None)
 ):
     """Copy a doc template to the current Drive folder."""
-    global _current_inputs, _current_source
-    
     credentials = get_credentials_from_session(session_id)
     if not credentials:
         raise HTTPException(status_code=401, detail="Please sign in with Google first")
@@ -675,11 +799,12 @@ async def copy_doc_to_folder(
     if request.template_id not in COPY_DOC_TEMPLATES:
         raise HTTPException(status_code=400, detail=f"Unknown template: {request.template_id}")
     
-    if not _current_source:
+    session = get_session_for_update(analysis_id)
+    if session is None or session.source is None:
         raise HTTPException(status_code=400, detail="No Drive folder selected. Please analyze a folder first.")
     
     template_file_id = COPY_DOC_TEMPLATES[request.template_id]
-    target_folder_id = _current_source.folder_id
+    target_folder_id = session.source.folder_id
     
     from googleapiclient.discovery import build
     
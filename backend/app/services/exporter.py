@@ -2,18 +2,96 @@
 
 import csv
 import io
-from typing import TextIO
+from typing import Iterable, Iterator
 
+from app.models.asset import ProcessedAsset
 from app.models.group import AdGroup, ExportRow, GroupType
 from app.services.namer import generate_filename, generate_carousel_filename
 
 
-def generate_export_rows(groups: list[AdGroup]) -> list[ExportRow]:
-    """Generate export rows for all groups.
+# Export columns, in order. These are also the ExportRow field names and the
+# keys of preview rows, so keep the three in sync.
+CSV_HEADER = [
+    "file_id",
+    "old_name",
+    "new_name",
+    "group_id",
+    "group_type",
+    "placement_inferred",
+    "confidence_group",
+    "confidence_product",
+    "confidence_angle",
+    "confidence_offer",
+]
+
+
+def _row_tuple(group: AdGroup, asset: ProcessedAsset, new_name: str) -> tuple:
+    """Build one export row as a plain tuple, in CSV_HEADER order."""
+    confidence = group.confidence
+    return (
+        asset.asset.id,
+        asset.asset.name,
+        new_name,
+        group.id,
+        group.group_type.value,
+        asset.placement.value,
+        round(confidence.group, 3),
+        round(confidence.product, 3),
+        round(confidence.angle, 3),
+        round(confidence.offer, 3),
+    )
+
+
+def _group_row_tuples(group: AdGroup) -> Iterator[tuple]:
+    """Yield the export row tuples for one group.
     
-    Each asset in each group gets one row with its new filename.
     For carousels, each card gets a unique filename (0001_CAR_Card01.png, etc.)
     For standard groups, all assets share the group filename.
+    """
+    if group.group_type == GroupType.CAROUSEL:
+        # Carousel: each card gets unique filename based on position
+        for card_index, asset in enumerate(group.assets, start=1):
+            yield _row_tuple(group, asset, generate_carousel_filename(group, asset, card_index))
+    else:
+        # Standard/Single: all assets share the group filename
+        new_name = generate_filename(group)
+        for asset in group.assets:
+            yield _row_tuple(group, asset, new_name)
+
+
+def iter_preview_rows(groups: list[AdGroup]) -> Iterator[dict]:
+    """Generate export rows as plain dicts keyed by CSV_HEADER.
+    
+    Skips ExportRow validation, for callers that only serialize the rows.
+    
+    Args:
+        groups: List of ad groups.
+        
+    Yields:
+        Row dicts.
+    """
+    for group in groups:
+        for values in _group_row_tuples(group):
+            yield dict(zip(CSV_HEADER, values))
+
+
+def iter_export_rows(groups: list[AdGroup]) -> Iterator[ExportRow]:
+    """Generate export rows for all groups, one at a time.
+    
+    Each asset in each group gets one row with its new filename.
+    
+    Args:
+        groups: List of ad groups.
+        
+    Yields:
+        ExportRow objects.
+    """
+    for row in iter_preview_rows(groups):
+        yield ExportRow(**row)
+
+
+def generate_export_rows(groups: list[AdGroup]) -> list[ExportRow]:
+    """Generate export rows for all groups.
     
     Args:
         groups: List of ad groups.
@@ -21,92 +99,75 @@ def generate_export_rows(groups: list[AdGroup]) -> list[ExportRow]:
     Returns:
         List of ExportRow objects.
     """
-    rows = []
+    return list(iter_export_rows(groups))
+
+
+def iter_csv_rows(groups: list[AdGroup]) -> Iterator[str]:
+    """Yield the CSV export one group at a time.
     
-    for group in groups:
-        if group.group_type == GroupType.CAROUSEL:
-            # Carousel: each card gets unique filename based on position
-            for card_index, asset in enumerate(group.assets, start=1):
-                new_name = generate_carousel_filename(group, asset, card_index)
-                row = ExportRow(
-                    file_id=asset.asset.id,
-                    old_name=asset.asset.name,
-                    new_name=new_name,
-                    group_id=group.id,
-                    group_type=group.group_type.value,
-                    placement_inferred=asset.placement.value,
-                    confidence_group=round(group.confidence.group, 3),
-                    confidence_product=round(group.confidence.product, 3),
-                    confidence_angle=round(group.confidence.angle, 3),
-                    confidence_offer=round(group.confidence.offer, 3),
-                )
-                rows.append(row)
-        else:
-            # Standard/Single: all assets share the group filename
-            new_name = generate_filename(group)
-            
-            for asset in group.assets:
-                row = ExportRow(
-                    file_id=asset.asset.id,
-                    old_name=asset.asset.name,
-                    new_name=new_name,
-                    group_id=group.id,
-                    group_type=group.group_type.value,
-                    placement_inferred=asset.placement.value,
-                    confidence_group=round(group.confidence.group, 3),
-                    confidence_product=round(group.confidence.product, 3),
-                    confidence_angle=round(group.confidence.angle, 3),
-                    confidence_offer=round(group.confidence.offer, 3),
-                )
-                rows.append(row)
-    
-    return rows
+    A single buffer is reused for every group, so memory stays bounded to one
+    group's lines regardless of how many groups are exported. Rows are
+    written as tuples without building ExportRow models.
+    
+    Groups are read lazily, as each chunk is requested; use
+    iter_csv_snapshot when the groups may change while the CSV is consumed.
+    
+    Args:
+        groups: List of ad groups.
+        
+    Yields:
+        CSV-encoded chunks, starting with the header.
+    """
+    return _iter_csv(map(_group_row_tuples, groups))
 
 
-def export_to_csv(groups: list[AdGroup]) -> str:
-    """Export groups to CSV string.
+def iter_csv_snapshot(groups: list[AdGroup]) -> Iterator[str]:
+    """Render every row now and return an iterator over the CSV chunks.
+    
+    Unlike iter_csv_rows, the rows are built before this returns, so edits
+    made to the groups while the chunks are consumed (e.g. between chunks of
+    a streaming response) don't show up in the export.
     
     Args:
         groups: List of ad groups.
         
     Returns:
-        CSV content as string.
+        Iterator of CSV-encoded chunks, starting with the header.
     """
-    rows = generate_export_rows(groups)
+    return _iter_csv([list(_group_row_tuples(group)) for group in groups])
+
+
+def _iter_csv(row_groups: Iterable[Iterable[tuple]]) -> Iterator[str]:
+    """Yield CSV chunks: the header, then one chunk per group of row tuples."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
     
-    output = io.StringIO()
-    writer = csv.writer(output)
+    def _flush() -> str:
+        line = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return line
     
     # Write header
-    writer.writerow([
-        "file_id",
-        "old_name",
-        "new_name",
-        "group_id",
-        "group_type",
-        "placement_inferred",
-        "confidence_group",
-        "confidence_product",
-        "confidence_angle",
-        "confidence_offer",
-    ])
-    
-    # Write rows
-    for row in rows:
-        writer.writerow([
-            row.file_id,
-            row.old_name,
-            row.new_name,
-            row.group_id,
-            row.group_type,
-            row.placement_inferred,
-            row.confidence_group,
-            row.confidence_product,
-            row.confidence_angle,
-            row.confidence_offer,
-        ])
-    
-    return output.getvalue()
+    writer.writerow(CSV_HEADER)
+    yield _flush()
+    
+    # Write rows, one group at a time
+    for rows in row_groups:
+        writer.writerows(rows)
+        yield _flush()
+
+
+def export_to_csv(groups: list[AdGroup]) -> str:
+    """Export groups to CSV string.
+    
+    Args:
+        groups: List of ad groups.
+        
+    Returns:
+        CSV content as string.
+    """
+    return "".join(iter_csv_rows(groups))
 
 
 def write_csv_to_file(groups: list[AdGroup], file_path: str) -> None:
@@ -116,6 +177,5 @@ def write_csv_to_file(groups: list[AdGroup], file_path: str) -> None:
         groups: List of ad groups.
         file_path: Path to write the CSV file.
     """
-    content = export_to_csv(groups)
     with open(file_path, "w", newline="") as f:
-        f.write(content)
+        f.writelines(iter_csv_rows(groups))
@@ -6,6 +6,7 @@ from PIL import Image
 import imagehash
 
 from app.models.asset import Asset, AssetType
+from app.services.workers import run_in_pool
 
 
 async def compute_fingerprint(asset: Asset, frame_paths: list[str] = None) -> str:
@@ -42,6 +43,12 @@ async def _hash_image(image_path: Path) -> str:
     Returns:
         Hash as hex string.
     """
+    # Image decoding and hashing are CPU-bound, run them in the worker pool
+    return await run_in_pool(_hash_image_sync, image_path)
+
+
+def _hash_image_sync(image_path: Path) -> str:
+    """Blocking implementation of _hash_image."""
     try:
         with Image.open(image_path) as img:
             # Use average hash (fast and effective)
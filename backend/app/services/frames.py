@@ -1,13 +1,19 @@
 """Video frame extraction service using ffmpeg."""
 
+import asyncio
 import subprocess
 from pathlib import Path
+from typing import Optional
 
 from app.models.asset import Asset
 from app.config import settings
 
 
-async def extract_frames(asset: Asset, output_dir: Path = None) -> list[str]:
+async def extract_frames(
+    asset: Asset,
+    output_dir: Path = None,
+    duration: Optional[float] = None,
+) -> list[str]:
     """Extract frames from a video asset.
     
     Extracts first frame, last frame, and 1 frame per second.
@@ -15,6 +21,8 @@ async def extract_frames(asset: Asset, output_dir: Path = None) -> list[str]:
     Args:
         asset: The video asset to extract frames from.
         output_dir: Directory to save frames. Defaults to temp_dir/frames.
+        duration: Video duration in seconds, if already known from metadata.
+            When omitted, it is probed with ffprobe.
         
     Returns:
         List of paths to extracted frame images.
@@ -36,7 +44,8 @@ async def extract_frames(asset: Asset, output_dir: Path = None) -> list[str]:
         frame_paths.append(str(first_frame))
     
     # Get video duration to extract frames at 1 fps
-    duration = await _get_video_duration(video_path)
+    if duration is None:
+        duration = await _get_video_duration(video_path)
     
     if duration and duration > 1:
         # Extract frames at 1 fps (starting from second 1)
@@ -77,7 +86,8 @@ async def _extract_frame_at_time(video_path: Path, output_path: Path, time_secon
     ]
     
     try:
-        subprocess.run(
+        await asyncio.to_thread(
+            subprocess.run,
             cmd,
             capture_output=True,
             check=True,
@@ -101,7 +111,9 @@ async def _get_video_duration(video_path: Path) -> float:
     ]
     
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result = await asyncio.to_thread(
+            subprocess.run, cmd, capture_output=True, text=True, check=True
+        )
         return float(result.stdout.strip())
     except (subprocess.CalledProcessError, ValueError, FileNotFoundError):
         # ffprobe not installed or failed - return default duration
@@ -68,7 +68,7 @@ async def group_assets(
     
     for asset in remaining:
         group = AdGroup(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,
             group_type=GroupType.SINGLE,
             assets=[asset],
             ad_number=current_ad_number,
@@ -122,7 +122,7 @@ async def _detect_carousels(
         sorted_feeds = sort_assets_by_filename_number(feeds)
         confidence = 0.3  # Low confidence since we're not using hash matching
         group = AdGroup(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,
             group_type=GroupType.CAROUSEL,
             assets=sorted_feeds,
             ad_number=current_number,
@@ -141,7 +141,7 @@ async def _detect_carousels(
             confidence = _calculate_group_confidence(sorted_cluster)
             
             group = AdGroup(
-                id=str(uuid.uuid4()),
+                id=uuid.uuid4().hex,
                 group_type=GroupType.CAROUSEL,
                 assets=sorted_cluster,
                 ad_number=current_number,
@@ -195,7 +195,7 @@ async def _match_story_feed_pairs(
         
         # Create group
         group = AdGroup(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,
             group_type=GroupType.STANDARD,
             assets=[story, feed],
             ad_number=current_number,
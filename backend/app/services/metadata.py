@@ -1,18 +1,34 @@
 """Metadata extraction service."""
 
+import asyncio
+import os
+import re
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
-import subprocess
-import json
 
+import av
 from PIL import Image
 
 from app.models.asset import Asset, AssetMetadata, AssetType
+from app.services.workers import run_in_pool
+
+
+# LRU cache of extracted metadata keyed by (path, mtime_ns, size), so
+# re-analyzing an unchanged folder skips the probes entirely
+_META_CACHE_MAX = 10_000
+_meta_cache: OrderedDict[tuple[str, int, int], AssetMetadata] = OrderedDict()
+
+# One "key = value" pair per line of mdls output
+_MDLS_RE = re.compile(r"^(\w+)\s*=\s*(.+)$", re.MULTILINE)
 
 
 async def extract_metadata(asset: Asset) -> AssetMetadata:
     """Extract metadata from an asset.
     
+    Results are cached per file and reused until the file's mtime or
+    size changes.
+    
     Args:
         asset: The asset to extract metadata from.
         
@@ -21,17 +37,34 @@ async def extract_metadata(asset: Asset) -> AssetMetadata:
     """
     path = Path(asset.path)
     
+    try:
+        st = os.stat(path)
+        key = (str(path), st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = None
+    
+    if key is not None and key in _meta_cache:
+        _meta_cache.move_to_end(key)
+        return _meta_cache[key]
+    
     if asset.asset_type == AssetType.IMAGE:
-        return await _extract_image_metadata(path)
+        metadata = await _extract_image_metadata(path)
     else:
-        return await _extract_video_metadata(path)
+        metadata = await _extract_video_metadata(path)
+    
+    if key is not None:
+        _meta_cache[key] = metadata
+        if len(_meta_cache) > _META_CACHE_MAX:
+            _meta_cache.popitem(last=False)
+    
+    return metadata
 
 
 async def _extract_image_metadata(path: Path) -> AssetMetadata:
     """Extract metadata from an image file."""
-    with Image.open(path) as img:
-        width, height = img.size
-        
+    # Header-only read: cheaper in a thread than a round-trip to the pool
+    width, height = await asyncio.to_thread(_read_image_size, path)
+    
     return AssetMetadata(
         width=width,
         height=height,
@@ -39,58 +72,66 @@ async def _extract_image_metadata(path: Path) -> AssetMetadata:
     )
 
 
-async def _extract_video_metadata(path: Path) -> AssetMetadata:
-    """Extract metadata from a video file using ffprobe, with macOS fallback."""
-    try:
-        # Use ffprobe to get video info
-        cmd = [
-            "ffprobe",
-            "-v", "quiet",
-            "-print_format", "json",
-            "-show_streams",
-            "-show_format",
-            str(path),
-        ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            raise RuntimeError(f"ffprobe failed: {result.stderr}")
-        
-        data = json.loads(result.stdout)
-        
-        # Find video stream
-        video_stream = None
-        for stream in data.get("streams", []):
-            if stream.get("codec_type") == "video":
-                video_stream = stream
-                break
-        
-        if not video_stream:
+def _read_image_size(path: Path) -> tuple[int, int]:
+    """Read image dimensions (blocking)."""
+    with Image.open(path) as img:
+        return img.size
+
+
+async def _run(cmd: list[str]) -> tuple[int, str, str]:
+    """Run a command without blocking the event loop.
+    
+    Returns:
+        Tuple of (return code, stdout, stderr).
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    out, err = await proc.communicate()
+    return proc.returncode, out.decode(), err.decode()
+
+
+def _probe_video(path: Path) -> tuple[int, int, Optional[float]]:
+    """Read video dimensions and duration in-process with PyAV (blocking).
+    
+    Returns:
+        Tuple of (width, height, duration in seconds or None).
+    """
+    with av.open(str(path)) as container:
+        stream = next((s for s in container.streams if s.type == "video"), None)
+        if stream is None:
             raise ValueError("No video stream found")
         
-        width = int(video_stream.get("width", 0))
-        height = int(video_stream.get("height", 0))
+        width = stream.codec_context.width
+        height = stream.codec_context.height
         
-        # Get duration from format or stream
+        # Get duration from container or stream
         duration = None
-        if "format" in data and "duration" in data["format"]:
-            duration = float(data["format"]["duration"])
-        elif "duration" in video_stream:
-            duration = float(video_stream["duration"])
-        
-        return AssetMetadata(
-            width=width,
-            height=height,
-            duration=duration,
-            aspect_ratio=width / height if height > 0 else 0,
-        )
-        
-    except FileNotFoundError:
-        # ffprobe not installed - try macOS mdls fallback
+        if container.duration:
+            duration = float(container.duration) / av.time_base
+        elif stream.duration and stream.time_base:
+            duration = float(stream.duration * stream.time_base)
+    
+    return width, height, duration
+
+
+async def _extract_video_metadata(path: Path) -> AssetMetadata:
+    """Extract metadata from a video file using PyAV, with macOS fallback."""
+    try:
+        width, height, duration = await run_in_pool(_probe_video, path)
+    except Exception as e:
+        # Unreadable by libav - try macOS mdls fallback
+        print(f"PyAV probe failed for {path.name}: {e}")
         return await _extract_video_metadata_macos(path)
-    except json.JSONDecodeError as e:
-        raise RuntimeError(f"Failed to parse ffprobe output: {e}")
+    
+    return AssetMetadata(
+        width=width,
+        height=height,
+        duration=duration,
+        aspect_ratio=width / height if height > 0 else 0,
+    )
 
 
 async def _extract_video_metadata_macos(path: Path) -> AssetMetadata:
@@ -105,26 +146,17 @@ async def _extract_video_metadata_macos(path: Path) -> AssetMetadata:
             str(path),
         ]
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        returncode, stdout, _ = await _run(cmd)
         
-        if result.returncode == 0:
-            width = None
-            height = None
-            duration = None
-            
-            for line in result.stdout.split('\n'):
-                if 'kMDItemPixelWidth' in line and '=' in line:
-                    val = line.split('=')[1].strip()
-                    if val != '(null)':
-                        width = int(val)
-                elif 'kMDItemPixelHeight' in line and '=' in line:
-                    val = line.split('=')[1].strip()
-                    if val != '(null)':
-                        height = int(val)
-                elif 'kMDItemDurationSeconds' in line and '=' in line:
-                    val = line.split('=')[1].strip()
-                    if val != '(null)':
-                        duration = float(val)
+        if returncode == 0:
+            values = {
+                key: val.strip()
+                for key, val in _MDLS_RE.findall(stdout)
+                if val.strip() != "(null)"
+            }
+            width = int(values["kMDItemPixelWidth"]) if "kMDItemPixelWidth" in values else None
+            height = int(values["kMDItemPixelHeight"]) if "kMDItemPixelHeight" in values else None
+            duration = float(values["kMDItemDurationSeconds"]) if "kMDItemDurationSeconds" in values else None
             
             if width and height:
                 print(f"Using macOS metadata for video: {path.name} ({width}x{height})")
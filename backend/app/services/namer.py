@@ -1,9 +1,24 @@
 """Filename generation service."""
 
+import sys
+from functools import lru_cache
+
 from app.models.group import AdGroup, GroupType
 from app.models.asset import ProcessedAsset
 
 
+# Shared separator and offer strings
+_SEP = sys.intern("_")
+_YES = sys.intern("Yes")
+_NO = sys.intern("No")
+
+# Offer token indexed by the offer flag (False -> "No", True -> "Yes")
+_OFFER_TOKENS = (_NO, _YES)
+
+# 3-digit zero-padded ad numbers, precomputed for the usual range
+_AD3 = tuple(f"{i:03d}" for i in range(1000))
+
+
 def generate_carousel_filename(group: AdGroup, asset: ProcessedAsset, card_index: int) -> str:
     """Generate filename for a carousel card.
     
@@ -45,19 +60,34 @@ def generate_filename(group: AdGroup) -> str:
     Returns:
         Generated filename string.
     """
-    # Format ad number as 3-digit zero-padded
-    ad_number = f"{group.ad_number:03d}"
+    ad_number = group.ad_number
     
-    # Get format token
-    format_token = group.format_token
-    
-    # Offer as Yes/No
-    offer_str = "Yes" if group.offer else "No"
-    
-    # Assemble filename
-    filename = f"{ad_number}_{group.campaign}_{group.product}_{format_token}_{group.angle}_{offer_str}_{group.date}"
+    # 3-digit zero-padded ad number from the table, plus the shared tail
+    if 0 <= ad_number < 1000:
+        return _AD3[ad_number] + _SEP + _render_tail(
+            group.campaign, group.product, group.format_token, group.angle, group.offer, group.date
+        )
+    return (
+        f"{ad_number:03d}_{group.campaign}_{group.product}_{group.format_token}_"
+        f"{group.angle}_{_OFFER_TOKENS[group.offer]}_{group.date}"
+    )
+
+
+@lru_cache(maxsize=1024)
+def _render_tail(
+    campaign: str,
+    product: str,
+    format_token: str,
+    angle: str,
+    offer: bool,
+    date: str,
+) -> str:
+    """Render the part of a filename after the ad number.
     
-    return filename
+    Memoized without the ad number, which is unique per group, so groups
+    that share campaign/product/format/angle/offer/date share one entry.
+    """
+    return _SEP.join((campaign, product, format_token, angle, _OFFER_TOKENS[offer], date))
 
 
 def generate_filenames_for_groups(groups: list[AdGroup]) -> dict[str, str]:
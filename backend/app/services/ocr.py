@@ -7,6 +7,7 @@ from PIL import Image
 import pytesseract
 
 from app.models.asset import Asset, AssetType
+from app.services.workers import run_in_pool
 
 
 async def extract_text(asset: Asset, frame_paths: list[str] = None) -> str:
@@ -48,6 +49,12 @@ async def _ocr_image(image_path: Path) -> str:
     Returns:
         Extracted text, cleaned up.
     """
+    # Image decoding and tesseract are blocking, run them in the worker pool
+    return await run_in_pool(_ocr_image_sync, image_path)
+
+
+def _ocr_image_sync(image_path: Path) -> str:
+    """Blocking implementation of _ocr_image."""
     try:
         with Image.open(image_path) as img:
             # Convert to RGB if necessary
@@ -1,5 +1,6 @@
 """Abstract base class for asset sources."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import AsyncIterator
 
@@ -56,3 +57,18 @@ class AssetSource(ABC):
             URL to access the thumbnail (relative or absolute).
         """
         pass
+    
+    async def get_thumbnail_urls(self, asset_ids: list[str]) -> dict[str, str]:
+        """Get thumbnail URLs for several assets at once.
+        
+        Sources that can do this in a single pass should override it; the
+        default calls get_thumbnail_url for each asset concurrently.
+        
+        Args:
+            asset_ids: The unique identifiers of the assets.
+            
+        Returns:
+            Mapping of asset ID to thumbnail URL.
+        """
+        urls = await asyncio.gather(*[self.get_thumbnail_url(a) for a in asset_ids])
+        return dict(zip(asset_ids, urls))
@@ -5,6 +5,7 @@ import io
 import asyncio
 import shutil
 import subprocess
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -44,6 +45,9 @@ class GoogleDriveSource(AssetSource):
         self.folder_id = folder_id
         self.credentials = credentials
         self.service = build("drive", "v3", credentials=credentials)
+        # The underlying httplib2 client is not thread-safe; assets are
+        # processed concurrently, so serialize access to the service
+        self._service_lock = threading.Lock()
         
         # Local cache for downloaded files
         self.download_dir = settings.temp_dir / "drive_downloads"
@@ -149,13 +153,14 @@ class GoogleDriveSource(AssetSource):
     async def get_asset_bytes(self, asset_id: str) -> bytes:
         """Download asset bytes from Drive."""
         def _download():
-            request = self.service.files().get_media(fileId=asset_id)
-            buffer = io.BytesIO()
-            downloader = MediaIoBaseDownload(buffer, request)
-            
-            done = False
-            while not done:
-                _, done = downloader.next_chunk()
+            with self._service_lock:
+                request = self.service.files().get_media(fileId=asset_id)
+                buffer = io.BytesIO()
+                downloader = MediaIoBaseDownload(buffer, request)
+                
+                done = False
+                while not done:
+                    _, done = downloader.next_chunk()
             
             return buffer.getvalue()
         
@@ -168,10 +173,11 @@ class GoogleDriveSource(AssetSource):
         if not file_info:
             # Fetch file info
             def _get_info():
-                return self.service.files().get(
-                    fileId=asset_id,
-                    fields="id, name, mimeType"
-                ).execute()
+                with self._service_lock:
+                    return self.service.files().get(
+                        fileId=asset_id,
+                        fields="id, name, mimeType"
+                    ).execute()
             file_info = await asyncio.to_thread(_get_info)
             self._file_cache[asset_id] = file_info
         
@@ -290,11 +296,12 @@ class GoogleDriveSource(AssetSource):
             Updated file metadata
         """
         def _rename():
-            return self.service.files().update(
-                fileId=file_id,
-                body={"name": new_name},
-                supportsAllDrives=True,
-            ).execute()
+            with self._service_lock:
+                return self.service.files().update(
+                    fileId=file_id,
+                    body={"name": new_name},
+                    supportsAllDrives=True,
+                ).execute()
         
         return await asyncio.to_thread(_rename)
     
@@ -304,11 +311,12 @@ class GoogleDriveSource(AssetSource):
             return self._file_cache[file_id]
         
         def _get_info():
-            return self.service.files().get(
-                fileId=file_id,
-                fields="id, name, mimeType, thumbnailLink, size, webViewLink",
-                supportsAllDrives=True,
-            ).execute()
+            with self._service_lock:
+                return self.service.files().get(
+                    fileId=file_id,
+                    fields="id, name, mimeType, thumbnailLink, size, webViewLink",
+                    supportsAllDrives=True,
+                ).execute()
         
         info = await asyncio.to_thread(_get_info)
         self._file_cache[file_id] = info
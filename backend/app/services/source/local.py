@@ -74,30 +74,53 @@ class LocalFolderSource(AssetSource):
         return asset_id
     
     async def get_thumbnail_url(self, asset_id: str) -> str:
-        """Generate and return a thumbnail URL.
+        """Generate and return a thumbnail URL."""
+        urls = await self.get_thumbnail_urls([asset_id])
+        return urls[asset_id]
+    
+    async def get_thumbnail_urls(self, asset_ids: list[str]) -> dict[str, str]:
+        """Generate and return thumbnail URLs for several assets.
+        
+        The thumbnails directory is scanned once up front, so existing
+        thumbnails don't cost a filesystem check each.
+        """
+        existing = {entry.name for entry in os.scandir(self.thumbs_dir)}
+        return {
+            asset_id: await self._thumbnail_url(Path(asset_id), existing)
+            for asset_id in asset_ids
+        }
+    
+    async def _thumbnail_url(self, path: Path, existing: set[str]) -> str:
+        """Generate a thumbnail for one asset if needed and return its URL.
         
         For images, copy to temp and return URL.
         For videos, use extracted frame or generate via macOS Quick Look.
+        
+        Args:
+            path: Path to the asset.
+            existing: Names of files already in the thumbnails directory.
         """
-        path = Path(asset_id)
         asset_type = self._get_asset_type(path)
         
         if asset_type == AssetType.IMAGE:
             # Copy image to thumbnails directory for serving
             thumb_name = f"{path.stem}_thumb{path.suffix}"
-            thumb_path = self.thumbs_dir / thumb_name
             
-            if not thumb_path.exists():
-                shutil.copy(path, thumb_path)
+            if thumb_name not in existing:
+                shutil.copy(path, self.thumbs_dir / thumb_name)
+                existing.add(thumb_name)
             
             return f"/temp/thumbnails/{thumb_name}"
         
         # For videos, check if frame was already extracted by ffmpeg
-        frame_path = settings.temp_dir / "frames" / f"{path.stem}_frame_001.jpg"
         thumb_name = f"{path.stem}_thumb.png"
+        if thumb_name in existing:
+            return f"/temp/thumbnails/{thumb_name}"
+        
+        frame_path = settings.temp_dir / "frames" / f"{path.stem}_frame_001.jpg"
         thumb_path = self.thumbs_dir / thumb_name
         
-        if frame_path.exists() and not thumb_path.exists():
+        if frame_path.exists():
             shutil.copy(frame_path, thumb_path)
         
         # If no thumbnail yet, try macOS Quick Look as fallback
@@ -105,6 +128,7 @@ class LocalFolderSource(AssetSource):
             await self._generate_video_thumbnail_macos(path, thumb_path)
         
         if thumb_path.exists():
+            existing.add(thumb_name)
             return f"/temp/thumbnails/{thumb_name}"
         
         return ""
@@ -0,0 +1,91 @@
+"""Shared process pool for blocking per-asset work (probing, OCR, hashing)."""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def start_pool() -> ProcessPoolExecutor:
+    """Start the shared worker pool if it isn't running yet.
+    
+    Workers are spawned rather than forked, since the server process
+    already runs threads by the time the pool starts.
+    
+    Returns:
+        The running pool.
+    """
+    global _pool
+    
+    if _pool is None:
+        _pool = _new_pool()
+    return _pool
+
+
+def _new_pool() -> ProcessPoolExecutor:
+    """Create a worker pool with spawned workers."""
+    return ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def _replace_broken_pool(broken: ProcessPoolExecutor) -> None:
+    """Swap in a fresh pool if `broken` is still the current one.
+    
+    When a worker dies, every pending call fails at once; only the first
+    caller to get here replaces the pool, the rest just retry on it.
+    """
+    global _pool
+    
+    if _pool is broken:
+        broken.shutdown(wait=False, cancel_futures=True)
+        _pool = _new_pool()
+
+
+def shutdown_pool() -> None:
+    """Shut down the shared worker pool, if running."""
+    global _pool
+    
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+async def run_in_pool(func: Callable[..., Any], *args: Any) -> Any:
+    """Run a blocking, picklable function in the worker pool.
+    
+    Falls back to a thread when the pool hasn't been started (e.g. when the
+    services are used outside the app). If a worker dies (OOM kill, crash in
+    a native library) the pool is rebuilt and the call retried once; if it
+    breaks again the pool is rebuilt for later calls and the error raised,
+    so one bad input can't take the pool down for good.
+    
+    Args:
+        func: Module-level function to run.
+        *args: Picklable arguments for func.
+    
+    Returns:
+        The function's return value.
+    
+    Raises:
+        BrokenProcessPool: If the call broke the pool twice.
+    """
+    if _pool is None:
+        return await asyncio.to_thread(func, *args)
+    
+    loop = asyncio.get_running_loop()
+    for attempt in range(2):
+        pool = _pool
+        try:
+            return await loop.run_in_executor(pool, func, *args)
+        except BrokenProcessPool:
+            print(f"Worker pool broke running {func.__name__}, restarting it")
+            _replace_broken_pool(pool)
+            if attempt:
+                raise
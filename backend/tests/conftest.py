@@ -0,0 +1,57 @@
+"""Shared fixtures for backend tests."""
+
+from typing import Optional
+
+import pytest
+
+from app.models.asset import Asset, AssetMetadata, AssetType, ProcessedAsset
+from app.models.group import AdGroup, GroupedAssets, GroupType, UserInputs
+from app.routers import pipeline
+
+
+def make_asset(name: str, width: int = 1080, height: int = 1080) -> ProcessedAsset:
+    """Build a processed image asset."""
+    metadata = AssetMetadata(width=width, height=height, aspect_ratio=width / height)
+    return ProcessedAsset(
+        asset=Asset(id=f"/assets/{name}", name=name, path=f"/assets/{name}", asset_type=AssetType.IMAGE),
+        metadata=metadata,
+        placement=metadata.placement,
+    )
+
+
+def make_group(
+    group_id: str,
+    ad_number: int,
+    group_type: GroupType = GroupType.SINGLE,
+    assets: Optional[list[ProcessedAsset]] = None,
+    product: str = "",
+    angle: str = "",
+    offer: bool = False,
+) -> AdGroup:
+    """Build an ad group with a fixed campaign and date."""
+    return AdGroup(
+        id=group_id,
+        group_type=group_type,
+        assets=assets or [],
+        ad_number=ad_number,
+        product=product,
+        angle=angle,
+        offer=offer,
+        campaign="OctAds",
+        date="2026.10.15",
+    )
+
+
+@pytest.fixture
+def session():
+    """Store a session with a standard pair, a carousel and a single, and yield its id and state."""
+    pipeline._sessions.clear()
+    groups = GroupedAssets(groups=[
+        make_group("pair", 1, GroupType.STANDARD, [make_asset("story.png", 1080, 1920), make_asset("feed.png", 1080, 1350)]),
+        make_group("car", 2, GroupType.CAROUSEL, [make_asset("card1.png"), make_asset("card2.png"), make_asset("card3.png")]),
+        make_group("single", 3, GroupType.SINGLE, [make_asset("solo.png")]),
+    ])
+    state = pipeline.AnalysisSession(groups, UserInputs(client="Client", folder_path="/assets"))
+    analysis_id = pipeline._store_session(state)
+    yield analysis_id, state
+    pipeline._sessions.clear()
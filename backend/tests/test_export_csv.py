@@ -0,0 +1,31 @@
+"""Tests for the streaming CSV export endpoint."""
+
+import asyncio
+
+from app.routers import export, pipeline
+from app.services.exporter import export_to_csv
+
+
+async def _read_body(response) -> str:
+    chunks = [chunk async for chunk in response.body_iterator]
+    return "".join(c.decode() if isinstance(c, bytes) else c for c in chunks)
+
+
+def test_export_uses_rows_from_before_concurrent_edits(session):
+    analysis_id, state = session
+    expected = export_to_csv(state.groups.groups)
+    
+    async def export_with_edits() -> str:
+        response = await export.export_csv(analysis_id)
+        # Edits handled while the response is still streaming
+        await pipeline.regroup_asset(
+            pipeline.RegroupRequest(asset_id="/assets/solo.png", target_group_id="pair"),
+            analysis_id,
+        )
+        await pipeline.renumber_groups(pipeline.RenumberRequest(start_number=10), analysis_id)
+        return await _read_body(response)
+    
+    body = asyncio.run(export_with_edits())
+    
+    assert body == expected
+    assert body != export_to_csv(state.groups.groups)
@@ -0,0 +1,44 @@
+"""Tests for the Drive rename endpoint."""
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.routers import export, pipeline
+
+
+client = TestClient(app)
+
+
+class _RegroupingSource:
+    """Fake Drive source that moves an asset while the first rename is in flight."""
+    
+    def __init__(self, analysis_id: str):
+        self.analysis_id = analysis_id
+        self.renamed: list[tuple[str, str]] = []
+    
+    async def rename_file(self, file_id: str, new_name: str) -> None:
+        if not self.renamed:
+            await pipeline.regroup_asset(
+                pipeline.RegroupRequest(asset_id="/assets/card3.png", target_group_id="pair", destination_index=0),
+                self.analysis_id,
+            )
+        self.renamed.append((file_id, new_name))
+
+
+def test_rename_requires_analysis_id(session):
+    response = client.post("/api/export/rename")
+    
+    assert response.status_code == 400
+
+
+def test_rename_uses_names_from_before_concurrent_edits(session, monkeypatch):
+    analysis_id, state = session
+    monkeypatch.setattr(export, "get_credentials_from_session", lambda session_id: object())
+    state.source = _RegroupingSource(analysis_id)
+    expected = [(row.file_id, row.new_name) for row in export.iter_export_rows(state.groups.groups)]
+    
+    response = client.post(f"/api/export/rename?analysis_id={analysis_id}")
+    
+    assert response.status_code == 200
+    assert response.json()["success"] == len(expected)
+    assert state.source.renamed == expected
@@ -0,0 +1,33 @@
+"""Tests for standardized filename generation."""
+
+import pytest
+
+from app.services.namer import generate_filename, generate_filenames_for_groups
+from tests.conftest import make_group
+
+
+@pytest.mark.parametrize("ad_number, offer, expected", [
+    (1, False, "001_OctAds_Serum_IMG_Offer_No_2026.10.15"),
+    (42, True, "042_OctAds_Serum_IMG_Offer_Yes_2026.10.15"),
+    (999, False, "999_OctAds_Serum_IMG_Offer_No_2026.10.15"),
+    (1000, True, "1000_OctAds_Serum_IMG_Offer_Yes_2026.10.15"),
+    (-5, False, "-05_OctAds_Serum_IMG_Offer_No_2026.10.15"),
+])
+def test_generate_filename(ad_number, offer, expected):
+    assert generate_filename(make_group("g", ad_number, product="Serum", angle="Offer", offer=offer)) == expected
+
+
+def test_generate_filename_reflects_edits():
+    group = make_group("g", 7, product="Serum", angle="Offer")
+    assert generate_filename(group) == "007_OctAds_Serum_IMG_Offer_No_2026.10.15"
+    
+    group.product = "Cream"
+    group.offer = True
+    
+    assert generate_filename(group) == "007_OctAds_Cream_IMG_Offer_Yes_2026.10.15"
+
+
+def test_generate_filenames_for_groups_matches_scalar():
+    groups = [make_group(f"g{n}", n, product="Serum", angle="Offer", offer=n % 2 == 0) for n in range(995, 1005)]
+    
+    assert generate_filenames_for_groups(groups) == {g.id: generate_filename(g) for g in groups}
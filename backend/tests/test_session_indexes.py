@@ -0,0 +1,82 @@
+"""Tests for the analysis session lookup indexes kept in sync by regroup/reorder."""
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.routers import pipeline
+
+
+client = TestClient(app)
+
+
+def _assert_indexes(state: pipeline.AnalysisSession) -> None:
+    """Assert the indexes match the groups exactly, with no stale entries."""
+    groups = state.groups.groups
+    assert state.group_index == {g.id: g for g in groups}
+    assert len(state.asset_index) == sum(len(g.assets) for g in groups)
+    for g in groups:
+        for i, a in enumerate(g.assets):
+            owner, position = state.asset_index[a.asset.id]
+            assert owner is g
+            assert position == i
+
+
+def _regroup(analysis_id: str, **body):
+    return client.put(f"/api/groups/regroup?analysis_id={analysis_id}", json=body)
+
+
+def test_regroup_into_existing_group(session):
+    analysis_id, state = session
+    
+    response = _regroup(analysis_id, asset_id="/assets/card1.png", target_group_id="pair", destination_index=0)
+    
+    assert response.status_code == 200
+    pair = state.group_index["pair"]
+    assert [a.asset.name for a in pair.assets] == ["card1.png", "story.png", "feed.png"]
+    _assert_indexes(state)
+
+
+def test_regroup_into_new_group(session):
+    analysis_id, state = session
+    
+    response = _regroup(analysis_id, asset_id="/assets/feed.png")
+    
+    assert response.status_code == 200
+    assert len(state.groups.groups) == 4
+    new_group = state.groups.groups[-1]
+    assert [a.asset.name for a in new_group.assets] == ["feed.png"]
+    _assert_indexes(state)
+
+
+def test_regroup_emptying_source_group(session):
+    analysis_id, state = session
+    
+    response = _regroup(analysis_id, asset_id="/assets/solo.png", target_group_id="car")
+    
+    assert response.status_code == 200
+    assert "single" not in [g.id for g in state.groups.groups]
+    assert [a.asset.name for a in state.group_index["car"].assets][-1] == "solo.png"
+    _assert_indexes(state)
+
+
+def test_regroup_unknown_target_leaves_asset_in_place(session):
+    analysis_id, state = session
+    
+    response = _regroup(analysis_id, asset_id="/assets/story.png", target_group_id="missing")
+    
+    assert response.status_code == 404
+    assert [a.asset.name for a in state.group_index["pair"].assets] == ["story.png", "feed.png"]
+    _assert_indexes(state)
+
+
+def test_reorder(session):
+    analysis_id, state = session
+    
+    response = client.put(
+        f"/api/groups/car/reorder?analysis_id={analysis_id}",
+        json={"asset_id": "/assets/card3.png", "new_index": 0},
+    )
+    
+    assert response.status_code == 200
+    assert [a.asset.name for a in state.group_index["car"].assets] == ["card3.png", "card1.png", "card2.png"]
+    _assert_indexes(state)
@@ -3,6 +3,14 @@ import type { AnalyzeRequest, ConfigResponse, GroupedAssets, AdGroup, ExportRow,
 // Use environment variable for API base, fallback to /api for local dev with proxy
 const API_BASE = import.meta.env.VITE_API_URL || '/api';
 
+// Id of the current analysis, returned by /analyze and sent with later requests
+let analysisId: string | null = sessionStorage.getItem('analysis_id');
+
+function withAnalysis(url: string): string {
+  if (!analysisId) return url;
+  return `${url}?analysis_id=${encodeURIComponent(analysisId)}`;
+}
+
 async function fetchJson<T>(url: string, options?: RequestInit): Promise<T> {
   const response = await fetch(url, {
     ...options,
@@ -33,17 +41,22 @@ export const api = {
    * Analyze assets in a folder
    */
   async analyze(request: AnalyzeRequest): Promise<GroupedAssets> {
-    return fetchJson<GroupedAssets>(`${API_BASE}/analyze`, {
+    const result = await fetchJson<GroupedAssets>(`${API_BASE}/analyze`, {
       method: 'POST',
       body: JSON.stringify(request),
     });
+    analysisId = result.analysis_id ?? null;
+    if (analysisId) {
+      sessionStorage.setItem('analysis_id', analysisId);
+    }
+    return result;
   },
   
   /**
    * Get current grouped assets
    */
   async getGroups(): Promise<GroupedAssets> {
-    return fetchJson<GroupedAssets>(`${API_BASE}/groups`);
+    return fetchJson<GroupedAssets>(withAnalysis(`${API_BASE}/groups`));
   },
   
   /**
@@ -53,7 +66,7 @@ export const api = {
     groupId: string,
     updates: Partial<Pick<AdGroup, 'product' | 'angle' | 'hook' | 'creator' | 'offer' | 'campaign' | 'primary_text' | 'headline' | 'description' | 'cta' | 'url' | 'comment_media_buyer' | 'comment_client'>>
   ): Promise<AdGroup> {
-    return fetchJson<AdGroup>(`${API_BASE}/groups/${groupId}`, {
+    return fetchJson<AdGroup>(withAnalysis(`${API_BASE}/groups/${groupId}`), {
       method: 'PUT',
       body: JSON.stringify(updates),
     });
@@ -68,7 +81,7 @@ export const api = {
     updates: { headline?: string; description?: string; custom_filename?: string }
   ): Promise<ProcessedAsset> {
     // URL-encode the asset ID since it may contain slashes (file paths)
-    return fetchJson<ProcessedAsset>(`${API_BASE}/groups/${groupId}/assets/${encodeURIComponent(assetId)}`, {
+    return fetchJson<ProcessedAsset>(withAnalysis(`${API_BASE}/groups/${groupId}/assets/${encodeURIComponent(assetId)}`), {
       method: 'PUT',
       body: JSON.stringify(updates),
     });
@@ -78,7 +91,7 @@ export const api = {
    * Bulk find/replace a field value
    */
   async bulkReplace(field: string, find: string, replace: string): Promise<GroupedAssets> {
-    return fetchJson<GroupedAssets>(`${API_BASE}/bulk/replace`, {
+    return fetchJson<GroupedAssets>(withAnalysis(`${API_BASE}/bulk/replace`), {
       method: 'POST',
       body: JSON.stringify({ field, find, replace }),
     });
@@ -88,7 +101,7 @@ export const api = {
    * Apply a field value to selected groups
    */
   async bulkApply(groupIds: string[], field: string, value: string): Promise<GroupedAssets> {
-    return fetchJson<GroupedAssets>(`${API_BASE}/bulk/apply`, {
+    return fetchJson<GroupedAssets>(withAnalysis(`${API_BASE}/bulk/apply`), {
       method: 'POST',
       body: JSON.stringify({ group_ids: groupIds, field, value }),
     });
@@ -98,7 +111,7 @@ export const api = {
    * Export CSV and trigger download
    */
   async exportCsv(): Promise<void> {
-    const response = await fetch(`${API_BASE}/export`, {
+    const response = await fetch(withAnalysis(`${API_BASE}/export`), {
       method: 'POST',
     });
     
@@ -123,14 +136,14 @@ export const api = {
    * Preview export data
    */
   async previewExport(): Promise<{ rows: ExportRow[] }> {
-    return fetchJson<{ rows: ExportRow[] }>(`${API_BASE}/export/preview`);
+    return fetchJson<{ rows: ExportRow[] }>(withAnalysis(`${API_BASE}/export/preview`));
   },
 
   /**
    * Move an asset to a different group or create a new group
    */
   async regroupAsset(assetId: string, targetGroupId: string | null, destinationIndex?: number): Promise<GroupedAssets> {
-    return fetchJson<GroupedAssets>(`${API_BASE}/groups/regroup`, {
+    return fetchJson<GroupedAssets>(withAnalysis(`${API_BASE}/groups/regroup`), {
       method: 'PUT',
       body: JSON.stringify({ 
         asset_id: assetId, 
@@ -140,11 +153,21 @@ export const api = {
     });
   },
 
+  /**
+   * Renumber all groups sequentially from a starting number
+   */
+  async renumberGroups(startNumber: number): Promise<GroupedAssets> {
+    return fetchJson<GroupedAssets>(withAnalysis(`${API_BASE}/groups/renumber`), {
+      method: 'PUT',
+      body: JSON.stringify({ start_number: startNumber }),
+    });
+  },
+
   /**
    * Reorder an asset within its group (e.g., change carousel card order)
    */
   async reorderAsset(groupId: string, assetId: string, newIndex: number): Promise<AdGroup> {
-    return fetchJson<AdGroup>(`${API_BASE}/groups/${groupId}/reorder`, {
+    return fetchJson<AdGroup>(withAnalysis(`${API_BASE}/groups/${groupId}/reorder`), {
       method: 'PUT',
       body: JSON.stringify({ asset_id: assetId, new_index: newIndex }),
     });
@@ -182,7 +205,7 @@ export const api = {
    * Rename files in Google Drive to their new names
    */
   async renameFilesInDrive(): Promise<RenameResult> {
-    return fetchJson<RenameResult>(`${API_BASE}/export/rename`, {
+    return fetchJson<RenameResult>(withAnalysis(`${API_BASE}/export/rename`), {
       method: 'POST',
     });
   },
@@ -191,7 +214,7 @@ export const api = {
    * Get debug analysis info
    */
   async getDebugAnalysis(): Promise<unknown> {
-    return fetchJson<unknown>(`${API_BASE}/debug/analysis`);
+    return fetchJson<unknown>(withAnalysis(`${API_BASE}/debug/analysis`));
   },
 
   // ===== Copy Doc Templates =====
@@ -207,7 +230,7 @@ export const api = {
    * Copy a doc template to the current Drive folder
    */
   async copyDocToFolder(templateId: string): Promise<{ success: boolean; file_id: string; name: string; url: string }> {
-    return fetchJson<{ success: boolean; file_id: string; name: string; url: string }>(`${API_BASE}/copy-doc`, {
+    return fetchJson<{ success: boolean; file_id: string; name: string; url: string }>(withAnalysis(`${API_BASE}/copy-doc`), {
       method: 'POST',
       body: JSON.stringify({ template_id: templateId }),
     });
@@ -147,8 +147,7 @@ export default function ReviewPage() {
     if (isRecording) {
       // Stop recording - fetch the debug data
       try {
-        const response = await fetch('/api/debug/analysis');
-        const debug = await response.json();
+        const debug = await api.getDebugAnalysis();
         setDebugData(JSON.stringify(debug, null, 2));
       } catch (err) {
         setDebugData('Failed to fetch debug data: ' + (err instanceof Error ? err.message : 'Unknown error'));
@@ -194,13 +193,7 @@ export default function ReviewPage() {
 
   const handleRenumber = useCallback(async (startNumber: number) => {
     try {
-      const response = await fetch('/api/groups/renumber', {
-        method: 'PUT',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ start_number: startNumber }),
-      });
-      if (!response.ok) throw new Error('Renumber failed');
-      const newData = await api.getGroups();
+      const newData = await api.renumberGroups(startNumber);
       setData(newData);
     } catch (err) {
       console.error('Renumber failed:', err);
@@ -70,6 +70,7 @@ export interface AdGroup {
 export interface GroupedAssets {
   groups: AdGroup[];
   ungrouped: ProcessedAsset[];
+  analysis_id?: string;  // Returned by /analyze only
 }
 
 // API Types